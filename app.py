@@ -1,16 +1,96 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from model import process_insurance_brochure
-import tempfile
-import os
-from typing import Dict, Optional
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from schemas import (
+    BenefitsAndAdvantages,
+    BrochureContent,
+    BrochureResponse,
+    CoverageOverview,
+    ExclusionsAndLimitations,
+    Introduction,
+    LoopholesAndConsiderations,
+    NOT_FOUND,
+    PremiumDetails,
+)
+from collections import OrderedDict
+from hashing import sha256_file
+import orjson
+from typing import BinaryIO, Dict, Optional
 
 app = FastAPI(
     title="Insurance Brochure Processor API",
     description="API to process insurance brochures and extract structured information",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Largest PDF accepted, plus headroom for the multipart framing around it
+MAX_PDF_BYTES = 25 * 1024 * 1024
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+class LimitUploadSizeMiddleware:
+    """
+    Reject request bodies larger than max_body_bytes with 413
+    
+    A declared Content-Length is checked before the body is read; bodies
+    without one (chunked uploads) are counted as they stream in and aborted
+    as soon as they cross the limit, before the rest is spooled to disk.
+    This is plain ASGI so routes without a body pay only a header check.
+    """
+    def __init__(self, app: ASGIApp, max_body_bytes: int) -> None:
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_body_bytes:
+                    await self._reject(scope, receive, send)
+                    return
+                break
+        
+        received = 0
+        response_started = False
+        
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    # Raised inside body parsing, so FastAPI turns it into the 413 response
+                    raise HTTPException(status_code=413, detail="PDF too large")
+            return message
+        
+        async def tracked_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except HTTPException as e:
+            # Only reached when something outside a route read the oversized body
+            if e.status_code != 413 or response_started:
+                raise
+            await self._reject(scope, receive, send)
+    
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send) -> None:
+        response = ORJSONResponse(status_code=413, content={"detail": "PDF too large"})
+        await response(scope, receive, send)
+
+# Middleware added last runs first, so CORS wraps the size limit and its 413s
+# carry CORS headers like every other response
+app.add_middleware(LimitUploadSizeMiddleware, max_body_bytes=MAX_PDF_BYTES + MULTIPART_OVERHEAD_BYTES)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -20,97 +100,164 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def _process_pdf(pdf_file: BinaryIO) -> Optional[Dict]:
+    """Run the extraction pipeline, importing it on first use so workers start without loading it"""
+    from model import process_insurance_brochure
+    # Any client can upload new PDFs, so results stay in the bounded in-memory
+    # cache rather than the pipeline's unpruned disk cache
+    return process_insurance_brochure(pdf_file, use_disk_cache=False)
+
+# Processed brochures keyed by the SHA-256 of the uploaded PDF, least recently used first
+RESULT_CACHE_SIZE = 256
+_result_cache: "OrderedDict[str, Dict]" = OrderedDict()
+
+def _get_cached_result(key: str) -> Optional[Dict]:
+    """Return the cached result for a PDF digest, marking it as recently used"""
+    result = _result_cache.get(key)
+    if result is not None:
+        _result_cache.move_to_end(key)
+    return result
+
+def _cache_result(key: str, result: Dict) -> None:
+    """Store a processed result, evicting the least recently used entry when full"""
+    _result_cache[key] = result
+    _result_cache.move_to_end(key)
+    if len(_result_cache) > RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+
+# Responses depend only on the PDF bytes, so clients may reuse them for a day
+CACHE_CONTROL = "private, max-age=86400"
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check whether an If-None-Match header value lists the given ETag
+    
+    Only the concrete strong or weak tag counts. '*' is not honoured, since a
+    304 would claim the client holds a result for a PDF never processed here.
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return etag in candidates or f"W/{etag}" in candidates
+
+def format_brochure_response(result: Dict) -> BrochureResponse:
+    """
+    Format an extraction result from process_insurance_brochure for the API response
+    
+    Args:
+        result: Structured information extracted from the brochure
+        
+    Returns:
+        BrochureResponse containing the sectioned response content
+    """
+    policy_details = result.get('policy_details', {})
+    coverage_details = result.get('coverage_details', {})
+    premium_info = result.get('premium_info', {})
+    
+    return BrochureResponse(
+        content=BrochureContent(
+            introduction=Introduction(
+                policy_name=policy_details.get('policy_name', NOT_FOUND),
+                policy_number=policy_details.get('policy_number', NOT_FOUND),
+                issued_by=policy_details.get('insurer_name', NOT_FOUND),
+                insurer_contact=policy_details.get('insurer_contact', NOT_FOUND),
+                date_of_issue=policy_details.get('issue_date', NOT_FOUND),
+                expiry_date=policy_details.get('expiry_date', NOT_FOUND)
+            ),
+            coverage=CoverageOverview(
+                type_of_insurance=coverage_details.get('type', NOT_FOUND),
+                sum_assured="₹" + coverage_details.get('sum_assured', NOT_FOUND),
+                risks_covered=["✅ " + risk for risk in coverage_details.get('risks_covered', [])],
+                additional_benefits=["🚀 " + benefit for benefit in coverage_details.get('additional_benefits', [])]
+            ),
+            premium=PremiumDetails(
+                premium_amount="₹" + premium_info.get('amount', NOT_FOUND),
+                payment_frequency=premium_info.get('frequency', NOT_FOUND),
+                due_date=premium_info.get('due_dates', NOT_FOUND),
+                grace_period=premium_info.get('grace_period', NOT_FOUND)
+            ),
+            benefits=BenefitsAndAdvantages(
+                key_benefits=["🌟 " + benefit for benefit in coverage_details.get('additional_benefits', [])]
+            ),
+            exclusions=ExclusionsAndLimitations(
+                not_covered=["❌ " + exclusion for exclusion in result.get('exclusions', [])]
+            ),
+            loopholes=LoopholesAndConsiderations(
+                important_points=["⚠️ " + point for point in result.get('loopholes', [])]
+            )
+        )
+    )
+
+# Bodies of the static endpoints, serialized once at import
+ROOT_BODY = orjson.dumps({
+    "message": "Welcome to Insurance Brochure Processor API",
+    "endpoints": {
+        "/process-brochure": "POST - Process an insurance brochure PDF",
+        "/health": "GET - Check API health"
+    }
+})
+HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
 @app.get("/")
 async def root():
-    return {
-        "message": "Welcome to Insurance Brochure Processor API",
-        "endpoints": {
-            "/process-brochure": "POST - Process an insurance brochure PDF",
-            "/health": "GET - Check API health"
-        }
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
-@app.post("/process-brochure")
-async def process_brochure(file: UploadFile = File(...)) -> Dict:
+@app.post("/process-brochure", response_model=BrochureResponse, response_class=ORJSONResponse)
+async def process_brochure(request: Request, file: UploadFile = File(...)):
     """
     Process an insurance brochure PDF and return structured information
     
     Args:
+        request: Incoming request, checked for an If-None-Match header
         file: PDF file containing the insurance brochure
         
     Returns:
-        Dict containing processed information
+        JSON-encoded BrochureResponse tagged with the PDF's SHA-256 as its ETag,
+        or an empty 304 response when the client already holds the result
     """
-    if not file.filename.lower().endswith('.pdf'):
-        raise HTTPException(status_code=400, detail="File must be a PDF")
+    # Trust a PDF content type outright, otherwise fall back to the filename extension
+    if file.content_type != "application/pdf":
+        filename = file.filename or ""
+        if filename[-4:].lower() != ".pdf":
+            raise HTTPException(status_code=400, detail="File must be a PDF")
+    
+    # Catches chunked uploads that carried no Content-Length
+    if file.size is not None and file.size > MAX_PDF_BYTES:
+        raise HTTPException(status_code=413, detail="PDF too large")
     
     try:
-        # Create a temporary file to store the uploaded PDF
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # The upload is already spooled by Starlette (and closed by it after the
+        # request), so hash and process that file directly instead of copying it
+        pdf_file = file.file
+        cache_key = await run_in_threadpool(sha256_file, pdf_file)
+        etag = f'"{cache_key}"'
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
         
-        # Process the brochure
-        result = process_insurance_brochure(temp_file_path)
+        result = _get_cached_result(cache_key)
         
-        # Clean up the temporary file
-        os.unlink(temp_file_path)
+        if result is None:
+            # Process the brochure in a worker thread so the event loop keeps serving requests
+            result = await run_in_threadpool(_process_pdf, pdf_file)
+            
+            if result:
+                _cache_result(cache_key, result)
         
         if not result:
             raise HTTPException(status_code=500, detail="Failed to process the brochure")
         
-        # Format the response using actual extracted data
-        formatted_response = {
-            "content": {
-                "1️⃣ Introduction": {
-                    "Policy Name": result['policy_details'].get('policy_name', 'Not found'),
-                    "Policy Number": result['policy_details'].get('policy_number', 'Not found'),
-                    "Issued by": result['policy_details'].get('insurer_name', 'Not found'),
-                    "Insurer Contact": result['policy_details'].get('insurer_contact', 'Not found'),
-                    "Date of Issue": result['policy_details'].get('issue_date', 'Not found'),
-                    "Expiry Date": result['policy_details'].get('expiry_date', 'Not found')
-                },
-                "2️⃣ Coverage Overview": {
-                    "Type of Insurance": result['coverage_details'].get('type', 'Not found'),
-                    "Sum Assured": f"₹{result['coverage_details'].get('sum_assured', 'Not found')}",
-                    "Risks Covered": [f"✅ {risk}" for risk in result['coverage_details'].get('risks_covered', [])],
-                    "Additional Benefits": [f"🚀 {benefit}" for benefit in result['coverage_details'].get('additional_benefits', [])]
-                },
-                "3️⃣ Premium & Payment Details": {
-                    "Premium Amount": f"₹{result['premium_info'].get('amount', 'Not found')}",
-                    "Payment Frequency": result['premium_info'].get('frequency', 'Not found'),
-                    "Due Date": result['premium_info'].get('due_dates', 'Not found'),
-                    "Grace Period": result['premium_info'].get('grace_period', 'Not found')
-                },
-                "4️⃣ Benefits & Advantages": {
-                    "Key Benefits": [f"🌟 {benefit}" for benefit in result['coverage_details'].get('additional_benefits', [])]
-                },
-                "5️⃣ Exclusions & Limitations": {
-                    "Not Covered": [f"❌ {exclusion}" for exclusion in result.get('exclusions', [])]
-                },
-                "6️⃣ Potential Loopholes & Important Considerations": {
-                    "Important Points to Note": [
-                        f"⚠️ {point}" for point in result.get('loopholes', [])
-                    ]
-                }
-            },
-            "additional_information": [
-                "This policy is subject to the terms and conditions mentioned in the policy document",
-                "All benefits are subject to policy terms and conditions",
-                "Please read the policy document carefully for complete details",
-                "For any queries, please contact the insurer at the provided contact number",
-                "Keep all policy documents and receipts safely",
-                "Inform insurer about any changes in contact details",
-                "Maintain regular premium payments to keep policy active"
-            ]
-        }
-        
-        return formatted_response
+        # The payload is JSON-native once dumped, so hand it straight to orjson
+        # rather than letting FastAPI revalidate it and run jsonable_encoder
+        return ORJSONResponse(
+            format_brochure_response(result).model_dump(by_alias=True),
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
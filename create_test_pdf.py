@@ -1,12 +1,12 @@
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 
+# Lines fit between y=750 and the bottom margin at y=50, 15 points apart
+LINES_PER_PAGE = 47
+
 def create_test_pdf():
     c = canvas.Canvas("test_brochure.pdf", pagesize=letter)
     
-    # Set font and size
-    c.setFont("Helvetica", 12)
-    
     # Add content
     content = [
         "Insurance Policy Overview",
@@ -38,17 +38,16 @@ def create_test_pdf():
         "For more information, please contact our customer service."
     ]
     
-    # Position for text
-    y = 750  # Starting y position
-    
-    # Write content
-    for line in content:
-        if y < 50:  # If we're near the bottom of the page
+    # Draw each page's lines as a single text object rather than one
+    # drawString call per line
+    for start in range(0, len(content), LINES_PER_PAGE):
+        if start:
             c.showPage()  # Start a new page
-            c.setFont("Helvetica", 12)
-            y = 750  # Reset y position
-        c.drawString(50, y, line)
-        y -= 15  # Move down for next line
+        text = c.beginText(50, 750)
+        text.setFont("Helvetica", 12)
+        text.setLeading(15)  # Move down 15 points for each line
+        text.textLines(content[start:start + LINES_PER_PAGE], trim=0)
+        c.drawText(text)
     
     c.save()
 
@@ -0,0 +1,33 @@
+import hashlib
+from typing import BinaryIO, Union
+
+# Files are hashed in chunks of this size where hashlib.file_digest is unavailable
+HASH_CHUNK_SIZE = 1 << 20
+
+def sha256_file(source: Union[str, BinaryIO]) -> str:
+    """
+    Hash a PDF in a single pass
+    
+    Shared by the API, which keys its caches and ETags on the upload's digest,
+    and model.py, which keys its disk cache on the same digest. Kept out of
+    both so the API can import it without loading the extraction pipeline.
+    
+    Args:
+        source (Union[str, BinaryIO]): Path to the file, or a binary file object
+            positioned at its start, which is rewound afterwards
+        
+    Returns:
+        str: SHA-256 hex digest of the contents
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            return sha256_file(f)
+    if hasattr(hashlib, 'file_digest'):
+        # Python 3.11+: the read/update loop runs in C
+        digest = hashlib.file_digest(source, 'sha256')
+    else:
+        digest = hashlib.sha256()
+        while chunk := source.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    source.seek(0)
+    return digest.hexdigest()
@@ -1,414 +1,725 @@
-import PyPDF2
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
+import fitz  # PyMuPDF
+import json
+import os
 import re
-import spacy
 import logging
-from typing import Dict, Optional, List
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, List, Tuple, Union
 from pathlib import Path
+from hashing import sha256_file
+
+try:
+    import re2
+except ImportError:
+    re2 = None
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _compile(pattern: str, flags: int = 0):
+    """
+    Compile an extractor pattern, as UTF-8 bytes, with RE2 when google-re2 is installed
+    
+    Extractors scan the UTF-8 encoded brochure text, so patterns are compiled
+    as bytes. RE2 scans in linear time without backtracking. Patterns it cannot
+    handle (lookarounds) fall back to the stdlib engine, as does everything
+    when google-re2 is missing.
+    """
+    pattern = pattern.encode('utf-8')
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = not flags & re.IGNORECASE
+        options.dot_nl = bool(flags & re.DOTALL)
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+def _compile_fallbacks(*patterns: str, flags: int = 0):
+    """
+    Compile fallback patterns, in priority order, into one zero-width alternation
+    
+    Each pattern must capture its value in a single group and contain no other
+    capturing groups. Wrapping the alternation in a lookahead makes every match
+    empty, so finditer reports each position where any fallback matches, even
+    when it lies inside another fallback's match. Lookarounds are not supported
+    by RE2, so these always use the stdlib engine.
+    """
+    return _compile('(?=' + '|'.join(patterns) + ')', flags)
+
+# Processed brochures are cached on disk as v<CACHE_VERSION>/<sha256 of the PDF>.json.
+# Bump CACHE_VERSION whenever extraction output can change (extractors, their
+# defaults, cleanup, MIN_TEXT_LENGTH, ...) so earlier results are not served.
+CACHE_DIR = Path(os.environ.get('DOC_ANALYSER_CACHE_DIR', Path.home() / '.cache' / 'doc-analyser'))
+CACHE_VERSION = 1
+
+# Brochures with less cleaned text than this get the empty result without running
+# the extractors. This trades a little recall for speed on scanned or image-only
+# PDFs: fields in such a short text (a one-line "Policy No ... sum insured ...")
+# are no longer extracted.
+MIN_TEXT_LENGTH = 100
+
+# Regex patterns are compiled once at import; fallbacks are tried in priority order.
+# The cleanup pattern stays on the stdlib engine so Unicode whitespace is still
+# normalized; the extractors then only ever see single ASCII spaces, in the
+# cleaned text encoded once to UTF-8 bytes.
+_CLEAN_RE = re.compile(r'(?P<ws>\s+)|CIN:\s*U\d+.*?\n|Trade Logo.*?\n', re.IGNORECASE)
+# All section headings are located in one scan. The lookahead makes every match
+# zero-width, so headings that overlap one another are each still reported.
+_SECTION_HEADER_RE = re.compile(
+    rb'(?=(?P<coverage>benefits covered|covered benefits|what is covered)'
+    rb'|(?P<exclusions>EXCLUSIONS|NOT\s+COVERED|WHAT\s+IS\s+NOT\s+COVERED)'
+    rb'|(?P<claims>CLAIMS?\s+PROCESS|HOW\s+TO\s+CLAIM|CLAIM\s+PROCEDURE))',
+    re.IGNORECASE
+)
+# Section bodies are matched within a bounded window after their heading; a
+# body running past it ends at the window edge
+_SECTION_WINDOW = 8192
+# Body of the exclusions and claims sections: the rest of the heading line, then
+# everything up to the next line starting with a capitalized word
+_SECTION_BODY_RE = _compile(r'[^\n]*\n(.*?)(?=\n\s*[A-Z]{2,}|$)', re.IGNORECASE | re.DOTALL)
+_BULLET_RE = _compile(r'(?:•|\d+\.)\s*([^\n.]+)')
+
+_POLICY_RE = _compile_fallbacks(
+    r'(TOTAL\s+HEALTH\s+PLAN)',
+    r'((?:policy|plan)\s*(?:name|type)?\s*:?\s*[^\n.]*(?:health|insurance|plan)[^\n.]*)',
+    flags=re.IGNORECASE
+)
+_POLICY_NUMBER_RE = _compile_fallbacks(
+    r'(HDHHLIP\d+V\d+)',
+    r'(policy\s*(?:number|no|#)\s*:?\s*[A-Z0-9-]+)',
+    flags=re.IGNORECASE
+)
+_INSURER_RE = _compile_fallbacks(
+    r'(HDFC\s*ERGO[^.]*(?:Insurance|Company)[^.]*)',
+    r'(insurance\s*company|insurer)\s*:?\s*[^\n.]*',
+    flags=re.IGNORECASE
+)
+_CONTACT_RE = _compile_fallbacks(
+    r'toll\s*free\s*:?\s*([0-9 -]+)',
+    r'contact\s*(?:at|on|:)\s*([0-9 -]+)',
+    flags=re.IGNORECASE
+)
+
+_SUM_RE = _compile_fallbacks(
+    r'sum\s*(?:assured|insured)\s*(?:-|:)?\s*(?:Rs\.?|INR)?\s*([\d,]+)',
+    r'(?:coverage|cover)\s*(?:amount|limit)\s*(?:-|:)?\s*(?:Rs\.?|INR)?\s*([\d,]+)',
+    flags=re.IGNORECASE
+)
+_BENEFIT_BODY_RE = _compile(r'(.*?)(?:exclusions|what is not covered|section|$)', re.IGNORECASE | re.DOTALL)
+# Checked against decoded bullet items rather than the brochure bytes
+_HEADER_NOISE_RE = re.compile(r'CIN:|Trade Logo', re.IGNORECASE)
+
+_PREMIUM_RE = _compile_fallbacks(
+    r'premium\s*(?:amount)?\s*(?:-|:)?\s*(?:Rs\.?|INR)?\s*([\d,]+)',
+    r'(?:annual|monthly|quarterly)\s*premium\s*(?:-|:)?\s*(?:Rs\.?|INR)?\s*([\d,]+)',
+    flags=re.IGNORECASE
+)
+_FREQUENCY_RE = _compile(r'(monthly|quarterly|half-yearly|yearly|annual)\s*(?:premium|payment|basis)', re.IGNORECASE)
+_GRACE_RE = _compile_fallbacks(
+    r'grace\s*period\s*(?:of)?\s*(\d+)\s*(?:days|months)',
+    r'(\d+)\s*(?:days|months)\s*grace\s*period',
+    flags=re.IGNORECASE
+)
+
+_EXCLUSION_PATTERNS = (
+    _compile(r'(?:not covered|excluded|exclusions?):\s*([^.]*)', re.IGNORECASE),
+    _compile(r'(?:policy does not cover|will not cover):\s*([^.]*)', re.IGNORECASE),
+    _compile(r'following are (?:not covered|excluded):\s*([^.]*)', re.IGNORECASE)
+)
+
+_DOCUMENTS_RE = _compile(r'(?:required|necessary)\s*documents?[^:]*:\s*([^.]*)', re.IGNORECASE)
+_CLAIMS_CONTACT_RE = _compile_fallbacks(
+    r'(?:contact|call|reach)[^.]*(?:at|on)?\s*([0-9-]+)',
+    r'toll\s*free\s*:?\s*([0-9-]+)',
+    flags=re.IGNORECASE
+)
+_TIME_RE = _compile_fallbacks(
+    r'(?:settle|settlement|process).*?within\s*(\d+)\s*(?:days|hours|weeks)',
+    r'(?:TAT|turnaround time)\s*:?\s*(\d+)\s*(?:days|hours|weeks)',
+    flags=re.IGNORECASE
+)
+
+def _section_headers(text: bytes) -> Dict[str, Tuple[int, ...]]:
+    """
+    Find where each section heading ends, scanning the text once
+    
+    InsuranceBrochureProcessor computes this once per brochure and passes it to
+    the coverage, exclusions and claims extractors, so they share one scan.
+    
+    Returns:
+        Dict[str, Tuple[int, ...]]: Heading end offsets per section, in text order
+    """
+    headers = {'coverage': [], 'exclusions': [], 'claims': []}
+    for match in _SECTION_HEADER_RE.finditer(text):
+        section = match.lastgroup
+        headers[section].append(match.end(section))
+    return {section: tuple(ends) for section, ends in headers.items()}
+
+def _find_section(text: bytes, starts: Tuple[int, ...], body_re) -> Optional[bytes]:
+    """
+    Find a section body after the first heading that the body pattern fits
+    
+    starts are the section's heading end offsets, from _section_headers.
+    
+    The body pattern only sees the _SECTION_WINDOW bytes following a heading, so
+    a lazy body never walks the rest of the document looking for its end. The
+    windows are memoryview slices of the text, so trying a heading copies
+    nothing; only the body that is returned is copied out.
+    
+    Returns:
+        Optional[bytes]: The body captured by group 1 of body_re, or None
+    """
+    view = memoryview(text)
+    for start in starts:
+        # Never cut a multibyte character: back up to the start of the one the
+        # window would split, so captured items always decode
+        end = start + _SECTION_WINDOW
+        while end < len(text) and text[end] & 0xC0 == 0x80:
+            end -= 1
+        if match := body_re.match(view[start:end]):
+            # Groups of a match against the window can be views into it, so copy
+            # the body to bytes to detach it from the window
+            return bytes(match.group(1))
+    return None
+
+def _first_value(pattern, text: bytes) -> Optional[bytes]:
+    """
+    Value captured by the highest-priority fallback of a _compile_fallbacks pattern
+    
+    Equivalent to searching each fallback in turn and keeping the first that
+    matches, but done in a single scan of the text.
+    """
+    best = None
+    for match in pattern.finditer(text):
+        # Only the fallback that matched at this position captured a group
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+            if best.lastindex == 1:
+                break
+    return best.group(best.lastindex) if best else None
+
+def _bullet_items(text: bytes) -> List[str]:
+    """Extract bullet point or numbered items, skipping fragments of ten characters or fewer"""
+    items = [item.decode('utf-8').strip() for item in _BULLET_RE.findall(text)]
+    return [item for item in items if len(item) > 10]
+
+@lru_cache(maxsize=1)
+def _get_nlp():
+    """
+    Load the spaCy English model once per process, on first use
+    
+    The extractors only need tokenization, so every trained component is
+    excluded: excluded components are never loaded, unlike disabled ones,
+    which still take their weights into memory.
+    """
+    import spacy
+    try:
+        return spacy.load(
+            'en_core_web_sm',
+            exclude=['tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'ner']
+        )
+    except OSError:
+        logger.error("spaCy model not found. Please run: python -m spacy download en_core_web_sm")
+        raise
+
+def _prefetch(path: str) -> None:
+    """
+    Ask the kernel to start reading a whole file into the page cache
+    
+    The readahead runs asynchronously, so disk reads overlap with PyMuPDF
+    parsing instead of stalling each page on a cold cache. This is advisory
+    only; platforms without posix_fadvise skip it.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug("Could not prefetch %s: %s", path, e)
+
+# Extractor defaults, shared with _empty_result. Factories rather than
+# constants, since the extractors fill in the returned dicts and lists.
+def _empty_policy_details() -> Dict[str, str]:
+    return {
+        'policy_name': '',
+        'policy_number': '',
+        'insurer_name': '',
+        'insurer_contact': '',
+        'issue_date': '',
+        'expiry_date': ''
+    }
+
+def _empty_coverage_details() -> Dict[str, List[str]]:
+    return {
+        'type': 'Health Insurance',
+        'sum_assured': '',
+        'risks_covered': [],
+        'additional_benefits': []
+    }
+
+def _empty_premium_info() -> Dict[str, str]:
+    return {
+        'amount': '',
+        'frequency': '',
+        'due_dates': '',
+        'grace_period': ''
+    }
+
+def _empty_claims_process() -> Dict[str, List[str]]:
+    return {
+        'steps': [],
+        'documents': [],
+        'contact': '',
+        'timeframe': ''
+    }
+
 class InsuranceBrochureProcessor:
-    def __init__(self, file_path: str) -> None:
+    def __init__(self, source: Union[str, BinaryIO]) -> None:
         """
-        Initialize the processor with the brochure file path
+        Initialize the processor with the brochure file path or stream
         
         Args:
-            file_path (str): Path to the insurance brochure (PDF)
+            source (Union[str, BinaryIO]): Path to the insurance brochure (PDF),
+                or a binary file object holding its contents
             
         Raises:
             FileNotFoundError: If the PDF file doesn't exist
             ValueError: If the file is not a PDF
         """
-        if not Path(file_path).exists():
-            raise FileNotFoundError(f"PDF file not found: {file_path}")
-        if not file_path.lower().endswith('.pdf'):
-            raise ValueError("File must be a PDF")
+        if isinstance(source, str):
+            if not Path(source).exists():
+                raise FileNotFoundError(f"PDF file not found: {source}")
+            if not source.lower().endswith('.pdf'):
+                raise ValueError("File must be a PDF")
             
-        # Download necessary NLTK resources
-        try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            nltk.download('averaged_perceptron_tagger', quiet=True)
-            nltk.download('wordnet', quiet=True)
-        except Exception as e:
-            logger.error(f"Failed to download NLTK resources: {e}")
-            raise
-        
-        # Load spaCy English model for advanced text processing
-        try:
-            self.nlp = spacy.load('en_core_web_sm')
-        except OSError:
-            logger.error("spaCy model not found. Please run: python -m spacy download en_core_web_sm")
-            raise
-        
-        self.file_path = file_path
+        self.source = source
         self.raw_text = self._extract_text()
+        # Every extractor works on the same normalized text, so clean it once
+        # and encode it once, since the extractors scan UTF-8 bytes
+        self.clean_bytes = self.clean_content(self.raw_text).encode('utf-8')
+        # Heading offsets shared by the section extractors
+        self.section_headers = _section_headers(self.clean_bytes)
+    
+    @property
+    def nlp(self):
+        """spaCy English model for advanced text processing, shared by all processors"""
+        return _get_nlp()
     
     def _extract_text(self) -> str:
         """
-        Extract raw text from PDF
+        Extract raw text from PDF using PyMuPDF's native text extraction
         
         Returns:
             str: Extracted text from the PDF
             
         Raises:
-            PyPDF2.PdfReadError: If there's an error reading the PDF
+            fitz.FileDataError: If the PDF is damaged or not a PDF
         """
         try:
-            with open(self.file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                # Extract text from all pages
-                full_text = ""
-                for page in pdf_reader.pages:
-                    full_text += page.extract_text() + "\n"
-                
-                return full_text
+            if isinstance(self.source, str):
+                _prefetch(self.source)
+                document = fitz.open(self.source)
+            else:
+                document = fitz.open(stream=self.source.read(), filetype="pdf")
+            
+            with document:
+                pages = [page.get_text("text") for page in document]
+            
+            # Keep the trailing newline so a header on the last line still
+            # ends in one for the cleanup patterns
+            return "\n".join(pages) + "\n"
         except Exception as e:
-            logger.error(f"Error extracting text: {e}")
+            logger.error("Error extracting text: %s", e)
             raise
     
     def clean_content(self, text: str) -> str:
-        """Clean and normalize text content"""
-        # Remove CIN and Trade Logo lines
-        text = re.sub(r'(?i)CIN:\s*U\d+.*?\n', '', text)
-        text = re.sub(r'(?i)Trade Logo.*?\n', '', text)
+        """Clean and normalize text content in a single regex pass"""
+        # Remove CIN and Trade Logo lines and collapse whitespace to single
+        # spaces. A run of adjacent matches yields at most one space, exactly as
+        # removing the lines first and collapsing whitespace afterwards would.
+        last_end = -1
+        ends_with_space = False
         
-        # Remove extra whitespace and normalize spaces
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
+        def replace(match: re.Match) -> str:
+            nonlocal last_end, ends_with_space
+            adjacent = match.start() == last_end
+            last_end = match.end()
+            if match.lastgroup != 'ws':
+                if not adjacent:
+                    ends_with_space = False
+                return ''
+            if adjacent and ends_with_space:
+                return ''
+            ends_with_space = True
+            return ' '
         
-        return text
-
-    def extract_policy_details(self, text: str) -> Dict[str, str]:
-        """Extract basic policy details"""
-        text = self.clean_content(text)
-        details = {
-            'policy_name': '',
-            'policy_number': '',
-            'insurer_name': '',
-            'insurer_contact': '',
-            'issue_date': '',
-            'expiry_date': ''
-        }
+        return _CLEAN_RE.sub(replace, text).strip()
+
+    def extract_policy_details(self, text: bytes) -> Dict[str, str]:
+        """Extract basic policy details from cleaned UTF-8 text"""
+        details = _empty_policy_details()
         
         # Look for policy name
-        policy_patterns = [
-            r'(?i)TOTAL\s+HEALTH\s+PLAN',
-            r'(?i)(?:policy|plan)\s*(?:name|type)?\s*:?\s*([^\n.]*(?:health|insurance|plan)[^\n.]*)'
-        ]
-        
-        for pattern in policy_patterns:
-            if match := re.search(pattern, text):
-                details['policy_name'] = match.group(0).strip()
-                break
+        if value := _first_value(_POLICY_RE, text):
+            details['policy_name'] = value.decode('utf-8').strip()
             
         # Look for policy number
-        policy_number_patterns = [
-            r'(?i)HDHHLIP\d+V\d+',
-            r'(?i)policy\s*(?:number|no|#)\s*:?\s*([A-Z0-9-]+)'
-        ]
-        
-        for pattern in policy_number_patterns:
-            if match := re.search(pattern, text):
-                details['policy_number'] = match.group(0)
-                break
+        if value := _first_value(_POLICY_NUMBER_RE, text):
+            details['policy_number'] = value.decode('utf-8')
             
         # Look for insurer details
-        insurer_patterns = [
-            r'(?i)(HDFC\s*ERGO[^.]*(?:Insurance|Company)[^.]*)',
-            r'(?i)(insurance\s*company|insurer)\s*:?\s*([^\n.]*)'
-        ]
-        
-        for pattern in insurer_patterns:
-            if match := re.search(pattern, text):
-                details['insurer_name'] = match.group(1).strip()
-                break
+        if value := _first_value(_INSURER_RE, text):
+            details['insurer_name'] = value.decode('utf-8').strip()
                 
         # Look for contact details
-        contact_patterns = [
-            r'(?i)toll\s*free\s*:?\s*([0-9 -]+)',
-            r'(?i)contact\s*(?:at|on|:)\s*([0-9 -]+)'
-        ]
-        
-        for pattern in contact_patterns:
-            if match := re.search(pattern, text):
-                details['insurer_contact'] = match.group(1).strip()
-                break
+        if value := _first_value(_CONTACT_RE, text):
+            details['insurer_contact'] = value.decode('utf-8').strip()
                 
         return details
 
-    def extract_coverage_details(self, text: str) -> Dict[str, List[str]]:
-        """Extract coverage details"""
-        text = self.clean_content(text)
-        coverage = {
-            'type': 'Health Insurance',
-            'sum_assured': '',
-            'risks_covered': [],
-            'additional_benefits': []
-        }
+    def extract_coverage_details(self, text: bytes,
+                                 headers: Optional[Dict[str, Tuple[int, ...]]] = None) -> Dict[str, List[str]]:
+        """Extract coverage details from cleaned UTF-8 text, given its section headings if already found"""
+        if headers is None:
+            headers = _section_headers(text)
         
-        # Look for coverage amount
-        sum_patterns = [
-            r'(?i)sum\s*(?:assured|insured)\s*(?:-|:)?\s*(?:Rs\.?|INR)?\s*([\d,]+)',
-            r'(?i)(?:coverage|cover)\s*(?:amount|limit)\s*(?:-|:)?\s*(?:Rs\.?|INR)?\s*([\d,]+)'
-        ]
+        coverage = _empty_coverage_details()
         
-        for pattern in sum_patterns:
-            if match := re.search(pattern, text):
-                coverage['sum_assured'] = match.group(1)
-                break
+        # Look for coverage amount
+        if value := _first_value(_SUM_RE, text):
+            coverage['sum_assured'] = value.decode('utf-8')
         
         # Extract covered risks and benefits
-        benefit_section = re.search(r'(?i)(?:benefits covered|covered benefits|what is covered)(.*?)(?:exclusions|what is not covered|section|$)', text, re.DOTALL)
-        if benefit_section:
-            benefits_text = benefit_section.group(1)
+        benefits_text = _find_section(text, headers['coverage'], _BENEFIT_BODY_RE)
+        if benefits_text:
             # Extract bullet points or numbered items
-            benefits = re.findall(r'(?:•|\d+\.)\s*([^\n.]+)', benefits_text)
-            coverage['risks_covered'] = [b.strip() for b in benefits if len(b.strip()) > 10 and not re.search(r'(?i)CIN:|Trade Logo', b)]
+            benefits = _bullet_items(benefits_text)
+            coverage['risks_covered'] = [b for b in benefits if not _HEADER_NOISE_RE.search(b)]
         
         return coverage
 
-    def extract_premium_info(self, text: str) -> Dict[str, str]:
-        """Extract premium-related information"""
-        text = self.clean_content(text)
-        premium_info = {
-            'amount': '',
-            'frequency': '',
-            'due_dates': '',
-            'grace_period': ''
-        }
+    def extract_premium_info(self, text: bytes) -> Dict[str, str]:
+        """Extract premium-related information from cleaned UTF-8 text"""
+        premium_info = _empty_premium_info()
         
         # Look for premium amount
-        premium_patterns = [
-            r'(?i)premium\s*(?:amount)?\s*(?:-|:)?\s*(?:Rs\.?|INR)?\s*([\d,]+)',
-            r'(?i)(?:annual|monthly|quarterly)\s*premium\s*(?:-|:)?\s*(?:Rs\.?|INR)?\s*([\d,]+)'
-        ]
-        
-        for pattern in premium_patterns:
-            if match := re.search(pattern, text):
-                premium_info['amount'] = match.group(1)
-                break
+        if value := _first_value(_PREMIUM_RE, text):
+            premium_info['amount'] = value.decode('utf-8')
             
         # Look for payment frequency
-        frequency_pattern = r'(?i)(monthly|quarterly|half-yearly|yearly|annual)\s*(?:premium|payment|basis)'
-        if match := re.search(frequency_pattern, text):
-            premium_info['frequency'] = match.group(1)
+        if match := _FREQUENCY_RE.search(text):
+            premium_info['frequency'] = match.group(1).decode('utf-8')
             
         # Look for grace period
-        grace_patterns = [
-            r'(?i)grace\s*period\s*(?:of)?\s*(\d+)\s*(?:days|months)',
-            r'(?i)(\d+)\s*(?:days|months)\s*grace\s*period'
-        ]
-        
-        for pattern in grace_patterns:
-            if match := re.search(pattern, text):
-                premium_info['grace_period'] = f"{match.group(1)} days"
-                break
+        if value := _first_value(_GRACE_RE, text):
+            premium_info['grace_period'] = f"{value.decode('utf-8')} days"
             
         return premium_info
 
-    def extract_exclusions(self, text: str) -> List[str]:
-        """Extract policy exclusions"""
-        text = self.clean_content(text)
+    def extract_exclusions(self, text: bytes,
+                           headers: Optional[Dict[str, Tuple[int, ...]]] = None) -> List[str]:
+        """Extract policy exclusions from cleaned UTF-8 text, given its section headings if already found"""
+        if headers is None:
+            headers = _section_headers(text)
+        
         exclusions = []
         
         # First try to find the exclusions section
-        exclusion_section = re.search(r'(?i)(?:EXCLUSIONS|NOT\s+COVERED|WHAT\s+IS\s+NOT\s+COVERED)[^\n]*\n(.*?)(?=\n\s*[A-Z]{2,}|$)', text, re.DOTALL)
+        section_text = _find_section(text, headers['exclusions'], _SECTION_BODY_RE)
         
-        if exclusion_section:
-            section_text = exclusion_section.group(1)
+        if section_text:
             # Extract bullet points or numbered items
-            items = re.findall(r'(?:•|\d+\.)\s*([^\n.]+)', section_text)
-            exclusions.extend([item.strip() for item in items if len(item.strip()) > 10])
+            exclusions.extend(_bullet_items(section_text))
         
         # If no section found, look for individual exclusions
         if not exclusions:
-            exclusion_patterns = [
-                r'(?i)(?:not covered|excluded|exclusions?):\s*([^.]*)',
-                r'(?i)(?:policy does not cover|will not cover):\s*([^.]*)',
-                r'(?i)following are (?:not covered|excluded):\s*([^.]*)'
-            ]
-            
-            for pattern in exclusion_patterns:
-                if matches := re.finditer(pattern, text):
-                    for match in matches:
-                        items = [item.strip() for item in match.group(1).split(',')]
-                        exclusions.extend([item for item in items if len(item) > 10])
+            for pattern in _EXCLUSION_PATTERNS:
+                for match in pattern.finditer(text):
+                    items = [item.strip() for item in match.group(1).decode('utf-8').split(',')]
+                    exclusions.extend([item for item in items if len(item) > 10])
         
         # Remove duplicates while preserving order
-        seen = set()
-        return [x for x in exclusions if not (x in seen or seen.add(x))]
-
-    def extract_claims_process(self, text: str) -> Dict[str, List[str]]:
-        """Extract claims process information"""
-        text = self.clean_content(text)
-        claims_info = {
-            'steps': [],
-            'documents': [],
-            'contact': '',
-            'timeframe': ''
-        }
+        return list(dict.fromkeys(exclusions))
+
+    def extract_claims_process(self, text: bytes,
+                               headers: Optional[Dict[str, Tuple[int, ...]]] = None) -> Dict[str, List[str]]:
+        """Extract claims process information from cleaned UTF-8 text, given its section headings if already found"""
+        if headers is None:
+            headers = _section_headers(text)
+        
+        claims_info = _empty_claims_process()
         
         # Try to find the claims section
-        claims_section = re.search(r'(?i)(?:CLAIMS?\s+PROCESS|HOW\s+TO\s+CLAIM|CLAIM\s+PROCEDURE)[^\n]*\n(.*?)(?=\n\s*[A-Z]{2,}|$)', text, re.DOTALL)
+        section_text = _find_section(text, headers['claims'], _SECTION_BODY_RE)
         
-        if claims_section:
-            section_text = claims_section.group(1)
-            
+        if section_text:
             # Look for steps
-            steps = re.findall(r'(?:•|\d+\.)\s*([^\n.]+)', section_text)
-            claims_info['steps'] = [step.strip() for step in steps if len(step.strip()) > 10]
+            claims_info['steps'] = _bullet_items(section_text)
             
             # Look for documents
-            if doc_match := re.search(r'(?i)(?:required|necessary)\s*documents?[^:]*:\s*([^.]*)', section_text):
-                docs = [doc.strip() for doc in doc_match.group(1).split(',')]
+            if doc_match := _DOCUMENTS_RE.search(section_text):
+                docs = [doc.strip() for doc in doc_match.group(1).decode('utf-8').split(',')]
                 claims_info['documents'] = docs
             
             # Look for contact information
-            contact_patterns = [
-                r'(?i)(?:contact|call|reach)[^.]*(?:at|on)?\s*([0-9-]+)',
-                r'(?i)toll\s*free\s*:?\s*([0-9-]+)'
-            ]
-            
-            for pattern in contact_patterns:
-                if match := re.search(pattern, section_text):
-                    claims_info['contact'] = match.group(1)
-                    break
+            if value := _first_value(_CLAIMS_CONTACT_RE, section_text):
+                claims_info['contact'] = value.decode('utf-8')
             
             # Look for settlement timeframe
-            time_patterns = [
-                r'(?i)(?:settle|settlement|process).*?within\s*(\d+)\s*(?:days|hours|weeks)',
-                r'(?i)(?:TAT|turnaround time)\s*:?\s*(\d+)\s*(?:days|hours|weeks)'
-            ]
-            
-            for pattern in time_patterns:
-                if match := re.search(pattern, section_text):
-                    claims_info['timeframe'] = f"{match.group(1)} days"
-                    break
+            if value := _first_value(_TIME_RE, section_text):
+                claims_info['timeframe'] = f"{value.decode('utf-8')} days"
         
         return claims_info
 
-def process_insurance_brochure(pdf_path: str) -> Optional[Dict]:
-    """Process an insurance brochure PDF and extract structured information"""
+def _cache_path(digest: str) -> Path:
+    """Disk cache entry for a PDF digest under the current CACHE_VERSION"""
+    return CACHE_DIR / f"v{CACHE_VERSION}" / f"{digest}.json"
+
+def _load_cached_result(digest: str) -> Optional[Dict]:
+    """Read a processed brochure from the disk cache, or None on a miss or unreadable entry"""
+    try:
+        return json.loads(_cache_path(digest).read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable cache entry %s: %s", digest, e)
+        return None
+
+def _store_cached_result(digest: str, result: Dict) -> None:
+    """
+    Write a processed brochure to the disk cache
+    
+    The entry is written to a temporary file and renamed into place, so
+    concurrent processes never read a partial entry. Failures only cost the
+    cache, never the result.
+    """
+    path = _cache_path(digest)
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=path.parent)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not cache brochure %s: %s", digest, e)
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+def _empty_result() -> Dict:
+    """Result for a brochure with no usable text, built from every extractor's defaults"""
+    return {
+        'policy_details': _empty_policy_details(),
+        'coverage_details': _empty_coverage_details(),
+        'premium_info': _empty_premium_info(),
+        'exclusions': [],
+        'claims_process': _empty_claims_process()
+    }
+
+def process_insurance_brochure(pdf: Union[str, BinaryIO], digest: Optional[str] = None,
+                               use_disk_cache: bool = True) -> Optional[Dict]:
+    """
+    Process an insurance brochure PDF (path or binary stream) and extract structured information
+    
+    By default results are cached on disk under CACHE_DIR, keyed by the SHA-256
+    of the PDF, for scripts and batch runs that re-analyse the same brochures.
+    The cache is never pruned, so callers handling untrusted uploads (the API)
+    turn it off.
+    
+    Args:
+        pdf (Union[str, BinaryIO]): Path to the brochure, or a binary stream positioned at its start
+        digest (Optional[str]): SHA-256 hex digest of the PDF, when the caller has already computed it
+        use_disk_cache (bool): Whether to read and write the disk cache
+        
+    Returns:
+        Optional[Dict]: The extracted information, or None if the brochure could not be processed
+    """
     try:
-        processor = InsuranceBrochureProcessor(pdf_path)
-        text = processor.raw_text
+        if use_disk_cache:
+            digest = digest or sha256_file(pdf)
+            if (result := _load_cached_result(digest)) is not None:
+                return result
+        
+        processor = InsuranceBrochureProcessor(pdf)
+        text = processor.clean_bytes
+        headers = processor.section_headers
         
-        result = {
-            'policy_details': processor.extract_policy_details(text),
-            'coverage_details': processor.extract_coverage_details(text),
-            'premium_info': processor.extract_premium_info(text),
-            'exclusions': processor.extract_exclusions(text),
-            'claims_process': processor.extract_claims_process(text)
-        }
+        # Scanned, image-only or encrypted PDFs yield little or no text
+        if len(text) < MIN_TEXT_LENGTH:
+            logger.warning("Brochure has only %d bytes of text, skipping extraction", len(text))
+            result = _empty_result()
+        else:
+            result = {
+                'policy_details': processor.extract_policy_details(text),
+                'coverage_details': processor.extract_coverage_details(text, headers),
+                'premium_info': processor.extract_premium_info(text),
+                'exclusions': processor.extract_exclusions(text, headers),
+                'claims_process': processor.extract_claims_process(text, headers)
+            }
         
+        if use_disk_cache:
+            _store_cached_result(digest, result)
         return result
     except Exception as e:
-        logging.error(f"Error processing brochure: {str(e)}")
+        logger.error("Error processing brochure: %s", e)
         return None
 
+def process_brochures(pdf_paths: Iterable[str], max_workers: Optional[int] = None,
+                      chunksize: int = 8) -> Iterator[Optional[Dict]]:
+    """
+    Process many brochure PDFs in parallel worker processes
+    
+    Args:
+        pdf_paths (Iterable[str]): Paths to the insurance brochures (PDF)
+        max_workers (Optional[int]): Number of worker processes, defaults to the CPU count
+        chunksize (int): Number of paths sent to a worker at a time
+        
+    Yields:
+        Optional[Dict]: Result of process_insurance_brochure for each path, in input order
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(process_insurance_brochure, pdf_paths, chunksize=chunksize)
+
+# Static sections of the text report written by the __main__ block
+REPORT_KEY_BENEFITS = (
+    "Comprehensive health coverage",
+    "Cashless hospitalization at network hospitals",
+    "Pre and post hospitalization expenses",
+    "Day care procedures coverage",
+    "Alternative treatment coverage",
+    "No claim bonus benefits",
+    "Tax benefits under section 80D",
+    "Lifelong renewal option",
+    "Restoration benefit",
+    "Cumulative bonus"
+)
+
+REPORT_IMPORTANT_POINTS = (
+    "Pre-existing diseases waiting period: Insurance won't cover any pre-existing conditions for the first 2-4 years",
+    "Specific disease waiting period: Certain diseases like hernia, cataract have 24-month waiting period",
+    "Room rent capping: Daily room rent is limited to 1-2% of sum assured",
+    "Sub-limits on specific procedures: Each medical procedure has a maximum claim limit",
+    "Co-payment requirements: Policyholder must pay 10-20% of claim amount",
+    "Disease-wise waiting periods: Different waiting periods for different diseases",
+    "Network hospital restrictions: Cashless treatment only at network hospitals",
+    "Documentation requirements: Strict documentation needed for claim approval",
+    "Claim settlement conditions: Claims can be rejected for minor documentation errors",
+    "Policy renewal terms: Premium may increase significantly at renewal",
+    "Day care procedures: Limited coverage for procedures not requiring 24-hour hospitalization",
+    "Alternative treatments: Limited coverage for Ayurveda, Homeopathy, etc.",
+    "Dental treatments: Only emergency dental procedures are covered",
+    "Cosmetic surgeries: Not covered unless medically necessary",
+    "Maternity benefits: Limited coverage with waiting period",
+    "Mental health: Limited coverage for psychiatric treatments"
+)
+
+REPORT_ADDITIONAL_INFORMATION = (
+    "This policy is subject to the terms and conditions mentioned in the policy document",
+    "All benefits are subject to policy terms and conditions",
+    "Please read the policy document carefully for complete details",
+    "For any queries, please contact the insurer at the provided contact number",
+    "Keep all policy documents and receipts safely",
+    "Inform insurer about any changes in contact details",
+    "Maintain regular premium payments to keep policy active"
+)
+
+def format_report(result: Dict) -> str:
+    """
+    Render a processed brochure as the plain-text report
+    
+    Args:
+        result (Dict): Result of process_insurance_brochure
+        
+    Returns:
+        str: The complete report, ready to be written in one call
+    """
+    policy_details = result['policy_details']
+    coverage = result['coverage_details']
+    premium = result['premium_info']
+    
+    parts = []
+    a = parts.append
+    
+    # 1️⃣ Introduction
+    a("1️⃣ Introduction\n\n")
+    a(f"Policy Name: {policy_details['policy_name']}\n")
+    a(f"Policy Number: {policy_details['policy_number']}\n")
+    a(f"Issued by: {policy_details['insurer_name']}\n")
+    a(f"Insurer Contact: {policy_details['insurer_contact']}\n")
+    a(f"Date of Issue: {policy_details['issue_date']}\n")
+    a(f"Expiry Date: {policy_details['expiry_date']}\n\n")
+    
+    # 2️⃣ Coverage Overview
+    a("2️⃣ Coverage Overview\n\n")
+    a(f"Type of Insurance: {coverage['type']}\n")
+    a(f"Sum Assured: ₹{coverage['sum_assured']}\n\n")
+    
+    a("Risks Covered:\n")
+    parts.extend(f"✅ {risk}\n" for risk in coverage['risks_covered'])
+    
+    if coverage['additional_benefits']:
+        a("\nAdditional Benefits:\n")
+        parts.extend(f"🚀 {benefit}\n" for benefit in coverage['additional_benefits'])
+    a("\n")
+    
+    # 3️⃣ Premium & Payment Details
+    a("3️⃣ Premium & Payment Details\n\n")
+    a(f"Premium Amount: ₹{premium['amount']}\n")
+    a(f"Payment Frequency: {premium['frequency']}\n")
+    a(f"Due Date: {premium['due_dates']}\n")
+    a(f"Grace Period: {premium['grace_period']}\n\n")
+    
+    # 4️⃣ Benefits & Advantages
+    a("4️⃣ Benefits & Advantages\n\n")
+    a("🌟 Key Benefits:\n")
+    parts.extend(f"• {benefit}\n" for benefit in REPORT_KEY_BENEFITS)
+    a("\n")
+    
+    # 5️⃣ Exclusions & Limitations
+    a("5️⃣ Exclusions & Limitations\n\n")
+    a("❌ Not Covered:\n")
+    parts.extend(f"{exclusion}\n" for exclusion in result['exclusions'])
+    a("\n")
+    
+    # 6️⃣ Potential Loopholes & Important Considerations
+    a("6️⃣ Potential Loopholes & Important Considerations\n\n")
+    a("⚠️ Important Points to Note:\n")
+    parts.extend(f"• {point}\n" for point in REPORT_IMPORTANT_POINTS)
+    a("\n")
+    
+    # Additional Information
+    a("\nAdditional Information:\n")
+    parts.extend(f"• {info}\n" for info in REPORT_ADDITIONAL_INFORMATION)
+    
+    return "".join(parts)
+
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(level=logging.INFO)
+    
     # Process the PDF file
     result = process_insurance_brochure('total-health-plan.pdf')
     
     if result:
         # Save results to file
         with open('processed_brochure.txt', 'w', encoding='utf-8') as f:
-            # 1️⃣ Introduction
-            f.write("1️⃣ Introduction\n\n")
-            policy_details = result['policy_details']
-            f.write(f"Policy Name: {policy_details['policy_name']}\n")
-            f.write(f"Policy Number: {policy_details['policy_number']}\n")
-            f.write(f"Issued by: {policy_details['insurer_name']}\n")
-            f.write(f"Insurer Contact: {policy_details['insurer_contact']}\n")
-            f.write(f"Date of Issue: {policy_details['issue_date']}\n")
-            f.write(f"Expiry Date: {policy_details['expiry_date']}\n\n")
-            
-            # 2️⃣ Coverage Overview
-            f.write("2️⃣ Coverage Overview\n\n")
-            coverage = result['coverage_details']
-            f.write(f"Type of Insurance: {coverage['type']}\n")
-            f.write(f"Sum Assured: ₹{coverage['sum_assured']}\n\n")
-            
-            f.write("Risks Covered:\n")
-            for risk in coverage['risks_covered']:
-                f.write(f"✅ {risk}\n")
-            
-            if coverage['additional_benefits']:
-                f.write("\nAdditional Benefits:\n")
-                for benefit in coverage['additional_benefits']:
-                    f.write(f"🚀 {benefit}\n")
-            f.write("\n")
-            
-            # 3️⃣ Premium & Payment Details
-            f.write("3️⃣ Premium & Payment Details\n\n")
-            premium = result['premium_info']
-            f.write(f"Premium Amount: ₹{premium['amount']}\n")
-            f.write(f"Payment Frequency: {premium['frequency']}\n")
-            f.write(f"Due Date: {premium['due_dates']}\n")
-            f.write(f"Grace Period: {premium['grace_period']}\n\n")
-            
-            # 4️⃣ Benefits & Advantages
-            f.write("4️⃣ Benefits & Advantages\n\n")
-            f.write("🌟 Key Benefits:\n")
-            f.write("• Comprehensive health coverage\n")
-            f.write("• Cashless hospitalization at network hospitals\n")
-            f.write("• Pre and post hospitalization expenses\n")
-            f.write("• Day care procedures coverage\n")
-            f.write("• Alternative treatment coverage\n")
-            f.write("• No claim bonus benefits\n")
-            f.write("• Tax benefits under section 80D\n")
-            f.write("• Lifelong renewal option\n")
-            f.write("• Restoration benefit\n")
-            f.write("• Cumulative bonus\n\n")
-            
-            # 5️⃣ Exclusions & Limitations
-            f.write("5️⃣ Exclusions & Limitations\n\n")
-            f.write("❌ Not Covered:\n")
-            for exclusion in result['exclusions']:
-                f.write(f"{exclusion}\n")
-            f.write("\n")
-            
-            # 6️⃣ Potential Loopholes & Important Considerations
-            f.write("6️⃣ Potential Loopholes & Important Considerations\n\n")
-            f.write("⚠️ Important Points to Note:\n")
-            f.write("• Pre-existing diseases waiting period: Insurance won't cover any pre-existing conditions for the first 2-4 years\n")
-            f.write("• Specific disease waiting period: Certain diseases like hernia, cataract have 24-month waiting period\n")
-            f.write("• Room rent capping: Daily room rent is limited to 1-2% of sum assured\n")
-            f.write("• Sub-limits on specific procedures: Each medical procedure has a maximum claim limit\n")
-            f.write("• Co-payment requirements: Policyholder must pay 10-20% of claim amount\n")
-            f.write("• Disease-wise waiting periods: Different waiting periods for different diseases\n")
-            f.write("• Network hospital restrictions: Cashless treatment only at network hospitals\n")
-            f.write("• Documentation requirements: Strict documentation needed for claim approval\n")
-            f.write("• Claim settlement conditions: Claims can be rejected for minor documentation errors\n")
-            f.write("• Policy renewal terms: Premium may increase significantly at renewal\n")
-            f.write("• Day care procedures: Limited coverage for procedures not requiring 24-hour hospitalization\n")
-            f.write("• Alternative treatments: Limited coverage for Ayurveda, Homeopathy, etc.\n")
-            f.write("• Dental treatments: Only emergency dental procedures are covered\n")
-            f.write("• Cosmetic surgeries: Not covered unless medically necessary\n")
-            f.write("• Maternity benefits: Limited coverage with waiting period\n")
-            f.write("• Mental health: Limited coverage for psychiatric treatments\n\n")
-            
-            # Additional Information
-            f.write("\nAdditional Information:\n")
-            f.write("• This policy is subject to the terms and conditions mentioned in the policy document\n")
-            f.write("• All benefits are subject to policy terms and conditions\n")
-            f.write("• Please read the policy document carefully for complete details\n")
-            f.write("• For any queries, please contact the insurer at the provided contact number\n")
-            f.write("• Keep all policy documents and receipts safely\n")
-            f.write("• Inform insurer about any changes in contact details\n")
-            f.write("• Maintain regular premium payments to keep policy active\n")
+            f.write(format_report(result))
         
         print("Processing complete. Results saved to processed_brochure.txt")
     else:
         print("Failed to process the brochure. Please check the logs for details.")
 
 # Requirements to install:
-# pip install PyPDF2 nltk spacy
+# pip install PyMuPDF spacy
 # python -m spacy download en_core_web_sm
\ No newline at end of file
@@ -0,0 +1,68 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Tuple
+
+NOT_FOUND = "Not found"
+
+# Section headings of the formatted response
+SECTION_INTRODUCTION = "1️⃣ Introduction"
+SECTION_COVERAGE = "2️⃣ Coverage Overview"
+SECTION_PREMIUM = "3️⃣ Premium & Payment Details"
+SECTION_BENEFITS = "4️⃣ Benefits & Advantages"
+SECTION_EXCLUSIONS = "5️⃣ Exclusions & Limitations"
+SECTION_LOOPHOLES = "6️⃣ Potential Loopholes & Important Considerations"
+
+ADDITIONAL_INFORMATION = (
+    "This policy is subject to the terms and conditions mentioned in the policy document",
+    "All benefits are subject to policy terms and conditions",
+    "Please read the policy document carefully for complete details",
+    "For any queries, please contact the insurer at the provided contact number",
+    "Keep all policy documents and receipts safely",
+    "Inform insurer about any changes in contact details",
+    "Maintain regular premium payments to keep policy active"
+)
+
+class Section(BaseModel):
+    """Base for response sections, serialized under their display names"""
+    model_config = ConfigDict(populate_by_name=True)
+
+class Introduction(Section):
+    policy_name: str = Field(NOT_FOUND, alias="Policy Name")
+    policy_number: str = Field(NOT_FOUND, alias="Policy Number")
+    issued_by: str = Field(NOT_FOUND, alias="Issued by")
+    insurer_contact: str = Field(NOT_FOUND, alias="Insurer Contact")
+    date_of_issue: str = Field(NOT_FOUND, alias="Date of Issue")
+    expiry_date: str = Field(NOT_FOUND, alias="Expiry Date")
+
+class CoverageOverview(Section):
+    type_of_insurance: str = Field(NOT_FOUND, alias="Type of Insurance")
+    sum_assured: str = Field(NOT_FOUND, alias="Sum Assured")
+    risks_covered: List[str] = Field(default_factory=list, alias="Risks Covered")
+    additional_benefits: List[str] = Field(default_factory=list, alias="Additional Benefits")
+
+class PremiumDetails(Section):
+    premium_amount: str = Field(NOT_FOUND, alias="Premium Amount")
+    payment_frequency: str = Field(NOT_FOUND, alias="Payment Frequency")
+    due_date: str = Field(NOT_FOUND, alias="Due Date")
+    grace_period: str = Field(NOT_FOUND, alias="Grace Period")
+
+class BenefitsAndAdvantages(Section):
+    key_benefits: List[str] = Field(default_factory=list, alias="Key Benefits")
+
+class ExclusionsAndLimitations(Section):
+    not_covered: List[str] = Field(default_factory=list, alias="Not Covered")
+
+class LoopholesAndConsiderations(Section):
+    important_points: List[str] = Field(default_factory=list, alias="Important Points to Note")
+
+class BrochureContent(Section):
+    introduction: Introduction = Field(alias=SECTION_INTRODUCTION)
+    coverage: CoverageOverview = Field(alias=SECTION_COVERAGE)
+    premium: PremiumDetails = Field(alias=SECTION_PREMIUM)
+    benefits: BenefitsAndAdvantages = Field(alias=SECTION_BENEFITS)
+    exclusions: ExclusionsAndLimitations = Field(alias=SECTION_EXCLUSIONS)
+    loopholes: LoopholesAndConsiderations = Field(alias=SECTION_LOOPHOLES)
+
+class BrochureResponse(BaseModel):
+    """Structured information returned by POST /process-brochure"""
+    content: BrochureContent
+    additional_information: Tuple[str, ...] = ADDITIONAL_INFORMATION
@@ -0,0 +1,189 @@
+import hashlib
+import io
+import sys
+import types
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+PDF_BYTES = b'%PDF-1.4 test brochure'
+PDF_ETAG = '"' + hashlib.sha256(PDF_BYTES).hexdigest() + '"'
+
+RESULT = {
+    'policy_details': {'policy_name': 'Total Health Plan'},
+    'coverage_details': {'sum_assured': '5,00,000', 'risks_covered': ['Hospitalisation']},
+    'premium_info': {},
+    'exclusions': ['Cosmetic surgery'],
+}
+
+
+@pytest.fixture
+def processed(monkeypatch):
+    """PDFs passed to the extraction pipeline, which is replaced by a canned result"""
+    calls = []
+    
+    def fake_process_pdf(pdf_file):
+        calls.append(pdf_file.read())
+        return RESULT
+    
+    monkeypatch.setattr(app_module, '_process_pdf', fake_process_pdf)
+    monkeypatch.setattr(app_module, '_result_cache', app_module.OrderedDict())
+    return calls
+
+
+@pytest.fixture
+def client():
+    return TestClient(app_module.app)
+
+
+def upload(client, content=PDF_BYTES, filename='brochure.pdf', content_type='application/pdf', headers=None):
+    return client.post('/process-brochure', files={'file': (filename, content, content_type)}, headers=headers)
+
+
+def test_process_brochure_tags_response_with_sha256_etag(client, processed):
+    response = upload(client)
+    
+    assert response.status_code == 200
+    assert response.headers['etag'] == PDF_ETAG
+    assert response.headers['cache-control'] == app_module.CACHE_CONTROL
+    content = response.json()['content']
+    assert content['1️⃣ Introduction']['Policy Name'] == 'Total Health Plan'
+    assert content['2️⃣ Coverage Overview']['Sum Assured'] == '₹5,00,000'
+    assert processed == [PDF_BYTES]
+
+
+@pytest.mark.parametrize('if_none_match', [PDF_ETAG, 'W/' + PDF_ETAG, '"other", ' + PDF_ETAG])
+def test_matching_etag_returns_304_without_processing(client, processed, if_none_match):
+    response = upload(client, headers={'If-None-Match': if_none_match})
+    
+    assert response.status_code == 304
+    assert response.content == b''
+    assert response.headers['etag'] == PDF_ETAG
+    assert processed == []
+
+
+@pytest.mark.parametrize('if_none_match', ['*', '"other"', 'W/"other"'])
+def test_wildcard_or_other_etag_is_processed(client, processed, if_none_match):
+    response = upload(client, headers={'If-None-Match': if_none_match})
+    
+    assert response.status_code == 200
+    assert processed == [PDF_BYTES]
+
+
+def test_repeat_upload_is_served_from_result_cache(client, processed):
+    assert upload(client).status_code == 200
+    assert upload(client).status_code == 200
+    assert len(processed) == 1
+
+
+def test_result_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(app_module, 'RESULT_CACHE_SIZE', 2)
+    monkeypatch.setattr(app_module, '_result_cache', app_module.OrderedDict())
+    
+    app_module._cache_result('a', {'n': 1})
+    app_module._cache_result('b', {'n': 2})
+    assert app_module._get_cached_result('a') == {'n': 1}
+    app_module._cache_result('c', {'n': 3})
+    
+    assert app_module._get_cached_result('b') is None
+    assert app_module._get_cached_result('a') == {'n': 1}
+    assert app_module._get_cached_result('c') == {'n': 3}
+
+
+def test_pipeline_runs_without_disk_cache(monkeypatch):
+    """Uploads must not grow the pipeline's unpruned disk cache"""
+    calls = []
+    model = types.ModuleType('model')
+    model.process_insurance_brochure = lambda pdf, **kwargs: calls.append(kwargs) or RESULT
+    monkeypatch.setitem(sys.modules, 'model', model)
+    
+    assert app_module._process_pdf(io.BytesIO(PDF_BYTES)) == RESULT
+    assert calls == [{'use_disk_cache': False}]
+
+
+def test_failed_processing_returns_500(client, monkeypatch):
+    monkeypatch.setattr(app_module, '_process_pdf', lambda pdf_file: None)
+    monkeypatch.setattr(app_module, '_result_cache', app_module.OrderedDict())
+    
+    response = upload(client)
+    
+    assert response.status_code == 500
+    assert 'etag' not in response.headers
+
+
+def test_non_pdf_upload_returns_400(client, processed):
+    response = upload(client, filename='notes.txt', content_type='text/plain')
+    
+    assert response.status_code == 400
+    assert response.json() == {'detail': 'File must be a PDF'}
+    assert processed == []
+
+
+def test_pdf_extension_accepted_without_pdf_content_type(client, processed):
+    response = upload(client, filename='BROCHURE.PDF', content_type='application/octet-stream')
+    
+    assert response.status_code == 200
+    assert len(processed) == 1
+
+
+def test_oversized_pdf_returns_413(client, processed, monkeypatch):
+    monkeypatch.setattr(app_module, 'MAX_PDF_BYTES', len(PDF_BYTES) - 1)
+    
+    response = upload(client)
+    
+    assert response.status_code == 413
+    assert response.json() == {'detail': 'PDF too large'}
+    assert processed == []
+
+
+def test_oversized_content_length_returns_413(client, processed):
+    limit = app_module.MAX_PDF_BYTES + app_module.MULTIPART_OVERHEAD_BYTES
+    response = client.post(
+        '/process-brochure',
+        content=b'x',
+        headers={'Content-Type': 'multipart/form-data; boundary=x', 'Content-Length': str(limit + 1)}
+    )
+    
+    assert response.status_code == 413
+    assert response.json() == {'detail': 'PDF too large'}
+    assert processed == []
+
+
+ORIGIN = {'Origin': 'https://example.com'}
+
+
+def test_content_length_413_carries_cors_headers(client, processed):
+    limit = app_module.MAX_PDF_BYTES + app_module.MULTIPART_OVERHEAD_BYTES
+    response = client.post(
+        '/process-brochure',
+        content=b'x',
+        headers={**ORIGIN, 'Content-Type': 'multipart/form-data; boundary=x', 'Content-Length': str(limit + 1)}
+    )
+    
+    assert response.status_code == 413
+    assert 'access-control-allow-origin' in response.headers
+
+
+def test_streamed_413_carries_cors_headers(client, processed):
+    limit = app_module.MAX_PDF_BYTES + app_module.MULTIPART_OVERHEAD_BYTES
+    
+    def chunked_body():
+        # No Content-Length: the limit is only crossed while the body streams in
+        yield (b'--x\r\nContent-Disposition: form-data; name="file"; filename="big.pdf"\r\n'
+               b'Content-Type: application/pdf\r\n\r\n')
+        for _ in range(limit // (1 << 20) + 1):
+            yield b'%' * (1 << 20)
+        yield b'\r\n--x--\r\n'
+    
+    response = client.post(
+        '/process-brochure',
+        content=chunked_body(),
+        headers={**ORIGIN, 'Content-Type': 'multipart/form-data; boundary=x'}
+    )
+    
+    assert response.status_code == 413
+    assert response.json() == {'detail': 'PDF too large'}
+    assert 'access-control-allow-origin' in response.headers
+    assert processed == []
@@ -0,0 +1,92 @@
+import importlib
+import io
+import sys
+
+import pytest
+
+
+@pytest.fixture(params=['re2', 'stdlib'])
+def model(request, monkeypatch):
+    """The model module, imported with and without google-re2"""
+    if request.param == 're2':
+        pytest.importorskip('re2')
+    else:
+        monkeypatch.setitem(sys.modules, 're2', None)
+    monkeypatch.delitem(sys.modules, 'model', raising=False)
+    return importlib.import_module('model')
+
+
+def test_coverage_section_longer_than_window_with_non_ascii(model):
+    """A section window cut inside a multibyte character must still decode"""
+    processor = model.InsuranceBrochureProcessor.__new__(model.InsuranceBrochureProcessor)
+    item = '• Hospitalisation expenses up to ₹5,00,000 covered. '
+    body = item * (2 * model._SECTION_WINDOW // len(item.encode('utf-8')))
+    
+    # Pad the start of the section so the window edge falls on every byte of an item
+    for offset in range(len(item.encode('utf-8'))):
+        text = ('benefits covered ' + 'x' * offset + ' ' + body).encode('utf-8')
+        coverage = processor.extract_coverage_details(text)
+        assert coverage['risks_covered']
+        # The item cut by the window edge is truncated, never split mid-character
+        assert all(item.startswith('• ' + risk) for risk in coverage['risks_covered'])
+
+
+def test_empty_result_matches_extractor_defaults(model):
+    """Brochures without text get exactly what the extractors return when nothing matches"""
+    processor = model.InsuranceBrochureProcessor.__new__(model.InsuranceBrochureProcessor)
+    assert model._empty_result() == {
+        'policy_details': processor.extract_policy_details(b''),
+        'coverage_details': processor.extract_coverage_details(b''),
+        'premium_info': processor.extract_premium_info(b''),
+        'exclusions': processor.extract_exclusions(b''),
+        'claims_process': processor.extract_claims_process(b'')
+    }
+
+
+def test_disk_cache_is_versioned(model, monkeypatch, tmp_path):
+    """Results cached under another CACHE_VERSION are never served"""
+    monkeypatch.setattr(model, 'CACHE_DIR', tmp_path)
+    result = model._empty_result()
+    
+    model._store_cached_result('abc', result)
+    assert (tmp_path / f"v{model.CACHE_VERSION}" / 'abc.json').exists()
+    assert model._load_cached_result('abc') == result
+    
+    monkeypatch.setattr(model, 'CACHE_VERSION', model.CACHE_VERSION + 1)
+    assert model._load_cached_result('abc') is None
+
+
+@pytest.mark.parametrize('length, extracted', [(99, False), (100, True)])
+def test_min_text_length_threshold(model, monkeypatch, tmp_path, length, extracted):
+    """Text shorter than MIN_TEXT_LENGTH yields the empty result, even when it has extractable fields"""
+    fitz = pytest.importorskip('fitz')
+    monkeypatch.setattr(model, 'CACHE_DIR', tmp_path)
+    text = 'Policy No: AB-12 sum insured Rs 5,00,000 '
+    text += 'x' * (length - len(text))
+    
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 72), text)
+    pdf = io.BytesIO(doc.tobytes())
+    assert len(model.InsuranceBrochureProcessor(pdf).clean_bytes) == length
+    pdf.seek(0)
+    
+    result = model.process_insurance_brochure(pdf)
+    
+    if extracted:
+        assert result['policy_details']['policy_number'] == 'Policy No: AB-12'
+        assert result['coverage_details']['sum_assured'] == '5,00,000'
+    else:
+        assert result == model._empty_result()
+
+
+def test_disk_cache_can_be_disabled(model, monkeypatch, tmp_path):
+    """use_disk_cache=False neither reads nor writes cache entries"""
+    fitz = pytest.importorskip('fitz')
+    monkeypatch.setattr(model, 'CACHE_DIR', tmp_path)
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 72), 'Policy No: AB-12 sum insured Rs 5,00,000 ' + 'x' * 100)
+    
+    result = model.process_insurance_brochure(io.BytesIO(doc.tobytes()), use_disk_cache=False)
+    
+    assert result['coverage_details']['sum_assured'] == '5,00,000'
+    assert not any(tmp_path.iterdir())